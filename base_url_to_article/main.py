@@ -17,28 +17,46 @@ Run:
 Environment (.env or Docker env):
     SUPABASE_URL=https://supabase.sesai.in
     SUPABASE_KEY=<service_role key — NOT anon>
+    SCRAPE_WORKERS=4          # concurrent scrape jobs (rest wait in queue)
+    ARTICLE_CONCURRENCY=8     # pages per job used for article extraction
+    SEARCH_CONCURRENCY=4      # search terms run at once per job
+    FALLBACK_CONCURRENCY=4    # fallback-URL probes/pages open at once per job
+
+Database (optional, once):
+    sql/get_scrape_bootstrap.sql  — single-RPC job bootstrap; without it each
+                                    job falls back to per-table lookups
 """
 
 import asyncio
+import atexit
 import base64
+import hashlib
 import json
 import logging
+import math
 import os
 import re
 import sys
+import threading
 import time
 import uuid
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache, wraps
+from itertools import islice, repeat
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Optional
-from urllib.parse import quote_plus, urljoin, urlparse
+from urllib.parse import quote, quote_plus, urlparse
 
-from fastapi import FastAPI, BackgroundTasks, HTTPException
+import httpx
+from dateutil import parser as date_parser
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Error as PlaywrightError, async_playwright
 
 # ─── Windows asyncio fix (required for Playwright on Python 3.12+) ───────────
 if sys.platform == "win32":
@@ -54,18 +72,48 @@ except ImportError:
 # ─── Supabase ─────────────────────────────────────────────────────────────────
 try:
     from supabase import create_client, Client as SupabaseClient
+    from postgrest.utils import SyncClient as PostgrestSyncClient
 except ImportError:
     print("[FATAL] supabase-py not installed.")
     sys.exit(1)
 
+# ─── orjson (optional: faster JSON decode + API responses) ────────────────────
+try:
+    import orjson
+    json_loads = orjson.loads
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    json_loads = json.loads
+    from fastapi.responses import JSONResponse as DefaultResponse
+
+# ─── selectolax (optional: static-HTML fast path for article pages) ──────────
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# ─── RE2 (optional: linear-time regex for entity extraction) ─────────────────
+# Both entity patterns are compiled once at import with whichever engine
+# loaded; RE2 and stdlib `re` share the compile/finditer/findall API used here.
+try:
+    import re2 as entity_re
+except ImportError:
+    entity_re = re
+
 # ─── UTF-8 stdout (Windows fix) ───────────────────────────────────────────────
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
+# Records are formatted by the QueueHandler and written by a listener thread,
+# so coroutines logging per link/article never block on stdout.
+_log_queue = SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
 log = logging.getLogger(__name__)
 
 # ─── Date filter ──────────────────────────────────────────────────────────────
@@ -76,48 +124,92 @@ TWO_YEAR_CUTOFF = datetime.now(tz=timezone.utc) - timedelta(days=365 * 2)
 # IN-MEMORY JOB STORE  (last 200 jobs, thread-safe via asyncio single-thread)
 # ==============================================================================
 
-_jobs: OrderedDict = OrderedDict()   # job_id → dict
-MAX_JOBS = 200
+_jobs: dict       = {}                       # job_id → dict
+MAX_JOBS          = 200
+_job_order: deque = deque()                  # job_ids, oldest first
+MAX_PROGRESS      = 200                      # progress lines kept per job
+
+# Timestamps are stored as epoch floats and only rendered to ISO on read.
+_JOB_TS_FIELDS = ("created_at", "started_at", "finished_at")
 
 
 def _new_job(job_id: str, payload: dict) -> dict:
     job = {
         "job_id":      job_id,
         "status":      "queued",    # queued | running | done | error
-        "created_at":  datetime.utcnow().isoformat(),
+        "created_at":  time.time(),
         "started_at":  None,
         "finished_at": None,
         "payload":     payload,
-        "progress":    {},
+        "progress":    deque(maxlen=MAX_PROGRESS),   # (timestamp, message)
         "result":      None,
         "error":       None,
     }
+    if len(_job_order) >= MAX_JOBS:
+        # Drop the oldest *finished* job; queued/running ones are never
+        # evicted, so the store may briefly exceed MAX_JOBS under a backlog.
+        oldest_done = next((j for j in _job_order
+                            if _jobs[j]["status"] in ("done", "error")), None)
+        if oldest_done is not None:
+            _job_order.remove(oldest_done)
+            del _jobs[oldest_done]
+    _job_order.append(job_id)
     _jobs[job_id] = job
-    if len(_jobs) > MAX_JOBS:
-        _jobs.popitem(last=False)   # drop oldest
     return job
 
 
+def _iso(ts: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() if ts else None
+
+
+def _job_view(job: dict) -> dict:
+    return {
+        **job,
+        **{f: _iso(job[f]) for f in _JOB_TS_FIELDS},
+        "progress": {_iso(ts): msg for ts, msg in job["progress"]},
+    }
+
+
 # ==============================================================================
 # SHARED PLAYWRIGHT BROWSER
 # ==============================================================================
 
 _playwright_inst = None
 _browser         = None
+_http_client     = None   # httpx.AsyncClient for the static-HTML fast path
+_context_pool    = None   # ContextPool shared by the scrape workers
+
+# Scrape jobs run on a fixed pool of worker coroutines fed by this queue,
+# so a burst of POST /scrape calls can't open unbounded Chromium tabs.
+SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS", "4"))
+_scrape_queue: asyncio.Queue = asyncio.Queue()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _playwright_inst, _browser
+    global _playwright_inst, _browser, _http_client, _context_pool
+    _http_client = httpx.AsyncClient(
+        http2=True, timeout=15, follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_connections=100),
+    )
     log.info("[BOOT] Starting Playwright Chromium...")
     _playwright_inst = await async_playwright().start()
     _browser = await _playwright_inst.chromium.launch(
         headless=True,
         args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
     )
-    log.info("[BOOT] Playwright ready ✓")
+    _context_pool = ContextPool(_browser, SCRAPE_WORKERS)
+    await _context_pool.start()
+    workers = [asyncio.create_task(_scrape_worker(_scrape_queue)) for _ in range(SCRAPE_WORKERS)]
+    log.info(f"[BOOT] Playwright ready ✓ | {SCRAPE_WORKERS} scrape workers")
     yield
-    log.info("[SHUTDOWN] Closing browser...")
+    log.info("[SHUTDOWN] Stopping workers, closing browser...")
+    for w in workers:
+        w.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    await _http_client.aclose()
+    await _context_pool.close()
     if _browser:
         await _browser.close()
     if _playwright_inst:
@@ -133,6 +225,7 @@ app = FastAPI(
     description="Scrape articles from a URL using Playwright + save to Supabase.",
     version="5.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 app.add_middleware(
     CORSMiddleware,
@@ -162,22 +255,42 @@ class ScrapeAccepted(BaseModel):
 # JWT KEY VALIDATOR
 # ==============================================================================
 
+@lru_cache(maxsize=4)
 def decode_jwt_role(token: str) -> str:
     try:
         parts = token.strip().split(".")
         if len(parts) != 3:
             return "unknown"
         payload = parts[1] + "=" * (4 - len(parts[1]) % 4)
-        return json.loads(base64.b64decode(payload).decode()).get("role", "unknown")
+        return json_loads(base64.b64decode(payload)).get("role", "unknown")
     except Exception:
         return "unknown"
 
 
-def get_supabase_client() -> SupabaseClient:
-    url = os.getenv("SUPABASE_URL", "")
-    key = os.getenv("SUPABASE_KEY", "")
-    if not url or not key:
-        raise RuntimeError("SUPABASE_URL and SUPABASE_KEY must be set in environment.")
+# Shared by every job — batch inserts reuse warm keep-alive sockets.
+# httpx drops idle connections after 5s by default — shorter than the gap
+# between a job's bootstrap and its first insert — so keep them warm longer.
+POSTGREST_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100,
+                                keepalive_expiry=30)
+
+
+def _pool_postgrest_session(sb: SupabaseClient) -> None:
+    """
+    Swap postgrest's default session for one with explicit pool limits. Same
+    SyncClient type (keeps its aclose() shim); base URL, headers and timeout
+    are copied from the original, TLS verification stays on as before.
+    """
+    rest = sb.postgrest
+    old  = rest.session
+    rest.session = PostgrestSyncClient(
+        base_url=old.base_url, headers=old.headers, timeout=old.timeout,
+        verify=True, follow_redirects=True, http2=True, limits=POSTGREST_LIMITS,
+    )
+    old.close()
+
+
+@lru_cache(maxsize=1)
+def _create_supabase_client(url: str, key: str) -> SupabaseClient:
     role = decode_jwt_role(key)
     if role == "anon":
         raise RuntimeError(
@@ -186,27 +299,68 @@ def get_supabase_client() -> SupabaseClient:
         )
     if role != "service_role":
         log.warning(f"[KEY] JWT role='{role}' — not service_role, inserts may fail.")
-    return create_client(url, key)
+    sb = create_client(url, key)
+    _pool_postgrest_session(sb)
+    return sb
+
+
+def get_supabase_client() -> SupabaseClient:
+    url = os.getenv("SUPABASE_URL", "")
+    key = os.getenv("SUPABASE_KEY", "")
+    if not url or not key:
+        raise RuntimeError("SUPABASE_URL and SUPABASE_KEY must be set in environment.")
+    return _create_supabase_client(url, key)
 
 
 # ==============================================================================
-# SUPABASE DATA LOADING  (unchanged logic from scraper_v4)
+# SUPABASE DATA LOADING
 # ==============================================================================
 
+METADATA_CACHE_SIZE = 512
+METADATA_CACHE_TTL  = 300   # seconds
+
+
+def _ttl_cache(maxsize: int = METADATA_CACHE_SIZE, ttl: float = METADATA_CACHE_TTL):
+    """
+    Memoize a Supabase lookup on its arguments after `sb` for `ttl` seconds.
+    Failures are never cached. Lookups run via asyncio.to_thread, so cache
+    bookkeeping is locked (the lookup itself is not).
+    """
+    def decorator(fn):
+        cache: OrderedDict = OrderedDict()   # args → (expires_at, value)
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(sb: SupabaseClient, *args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+                if hit and hit[0] > now:
+                    cache.move_to_end(args)
+                    return hit[1]
+            value = fn(sb, *args)
+            with lock:
+                cache[args] = (now + ttl, value)
+                cache.move_to_end(args)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
 def fetch_base_url_row(sb: SupabaseClient, base_url: str, base_url_id_arg) -> dict:
     base_url = base_url.rstrip("/")
+    query = sb.table("ses_base_url").select("base_url_id,base_url,subsegment_id")
     if base_url_id_arg:
-        resp = (sb.table("ses_base_url")
-                .select("base_url_id,base_url,subsegment_id")
-                .eq("base_url_id", base_url_id_arg).limit(1).execute())
+        resp = query.eq("base_url_id", base_url_id_arg).limit(1).execute()
     else:
-        resp = (sb.table("ses_base_url")
-                .select("base_url_id,base_url,subsegment_id")
-                .eq("base_url", base_url).limit(1).execute())
-        if not resp.data:
-            resp = (sb.table("ses_base_url")
-                    .select("base_url_id,base_url,subsegment_id")
-                    .eq("base_url", base_url + "/").limit(1).execute())
+        # Both spellings in one round-trip; prefer the exact (no slash) match.
+        resp = (query.or_(f'base_url.eq."{base_url}",base_url.eq."{base_url}/"')
+                .limit(2).execute())
+        resp.data.sort(key=lambda r: r.get("base_url") != base_url)
     if not resp.data:
         raise ValueError(f"'{base_url}' not found in ses_base_url table.")
     row = resp.data[0]
@@ -214,9 +368,26 @@ def fetch_base_url_row(sb: SupabaseClient, base_url: str, base_url_id_arg) -> di
     return row
 
 
+@_ttl_cache()
 def fetch_subsegment_and_segment(sb: SupabaseClient, subsegment_id) -> tuple:
     if not subsegment_id:
         return None, None, None
+    try:
+        # Segment name comes back embedded via the segment_id foreign key.
+        resp = (sb.table("ses_subsegments")
+                .select("subsegment_id,subsegment_name,segment_id,ses_segments(segment_name)")
+                .eq("subsegment_id", subsegment_id).limit(1).execute())
+    except Exception as e:
+        log.warning(f"[DB] embedded segment lookup failed ({str(e)[:80]}) — using two queries")
+        return _fetch_subsegment_and_segment_separately(sb, subsegment_id)
+    if not resp.data:
+        return None, None, None
+    sub     = resp.data[0]
+    segment = sub.get("ses_segments") or {}
+    return sub.get("subsegment_name"), segment.get("segment_name"), sub.get("segment_id")
+
+
+def _fetch_subsegment_and_segment_separately(sb: SupabaseClient, subsegment_id) -> tuple:
     resp = (sb.table("ses_subsegments")
             .select("subsegment_id,subsegment_name,segment_id")
             .eq("subsegment_id", subsegment_id).limit(1).execute())
@@ -234,6 +405,7 @@ def fetch_subsegment_and_segment(sb: SupabaseClient, subsegment_id) -> tuple:
     return sub.get("subsegment_name"), seg_name, segment_id
 
 
+@_ttl_cache()
 def fetch_keywords(sb: SupabaseClient, subsegment_id) -> list:
     if not subsegment_id:
         return []
@@ -243,6 +415,7 @@ def fetch_keywords(sb: SupabaseClient, subsegment_id) -> list:
     return [r["keyword"] for r in resp.data if r.get("keyword")]
 
 
+@_ttl_cache()
 def load_search_pattern(sb: SupabaseClient, base_url_id: str, base_url: str) -> dict:
     resp = (sb.table("base_url_search_patterns")
             .select("method,pattern,confidence,result_type")
@@ -259,7 +432,10 @@ def load_search_pattern(sb: SupabaseClient, base_url_id: str, base_url: str) ->
             f"No search pattern in base_url_search_patterns for base_url_id={base_url_id}. "
             "Add a row there first."
         )
-    row = resp.data[0]
+    return _normalize_pattern(resp.data[0])
+
+
+def _normalize_pattern(row: dict) -> dict:
     return {
         "method":      row.get("method"),
         "pattern":     row.get("pattern"),
@@ -268,41 +444,237 @@ def load_search_pattern(sb: SupabaseClient, base_url_id: str, base_url: str) ->
     }
 
 
-def insert_articles(sb: SupabaseClient, rows: list) -> tuple:
+_bootstrap_rpc_disabled = False   # set once the RPC fails for a non-transient reason
+# SQLSTATE / PostgREST code prefixes worth retrying on the next job: connection,
+# serialization, resource and cancel/timeout classes, and PostgREST's own
+# "can't reach the database" errors.
+_TRANSIENT_DB_CODES = ("08", "40", "53", "57", "PGRST000", "PGRST001", "PGRST002", "PGRST003")
+
+
+def _is_transient_db_error(e: Exception) -> bool:
+    if isinstance(e, httpx.TransportError):
+        return True
+    return str(getattr(e, "code", None) or "").startswith(_TRANSIENT_DB_CODES)
+
+
+def fetch_scrape_bootstrap(sb: SupabaseClient, base_url: str, base_url_id_arg) -> dict:
+    """
+    Base URL row, subsegment/segment names, keywords and search pattern in a
+    single RPC (sql/get_scrape_bootstrap.sql). Falls back to the per-table
+    fetchers if the call fails. Anything but a transient failure (function not
+    deployed, a response that doesn't validate, ...) is remembered for the
+    process, so later jobs don't pay for a failing round-trip first.
+    """
+    global _bootstrap_rpc_disabled
+    base_url = base_url.rstrip("/")
+    if _bootstrap_rpc_disabled:
+        return _fetch_scrape_bootstrap_separately(sb, base_url, base_url_id_arg)
+    try:
+        rows = sb.rpc("get_scrape_bootstrap", {
+            "p_base_url": base_url, "p_base_url_id": base_url_id_arg,
+        }).execute().data
+    except Exception as e:
+        err = str(e)
+        if not _is_transient_db_error(e):
+            _bootstrap_rpc_disabled = True
+        log.warning(f"[DB] get_scrape_bootstrap RPC failed ({err[:80]}) — using per-table lookups")
+        return _fetch_scrape_bootstrap_separately(sb, base_url, base_url_id_arg)
+    boot = rows[0] if rows else None   # setof json: [] when the base URL is unknown
+    if not boot:
+        raise ValueError(f"'{base_url}' not found in ses_base_url table.")
+    base_url_id = str(boot["base_url_id"])
+    log.info(f"[DB] base_url_id={base_url_id}  subsegment_id={boot.get('subsegment_id')}")
+    if not boot.get("pattern"):
+        raise ValueError(
+            f"No search pattern in base_url_search_patterns for base_url_id={base_url_id}. "
+            "Add a row there first."
+        )
+    return {
+        "base_url_id":     base_url_id,
+        "subsegment_name": boot.get("subsegment_name"),
+        "segment_name":    boot.get("segment_name"),
+        "keywords":        [k for k in boot.get("keywords") or [] if k],
+        "pattern":         _normalize_pattern(boot["pattern"]),
+    }
+
+
+def _fetch_scrape_bootstrap_separately(sb: SupabaseClient, base_url: str, base_url_id_arg) -> dict:
+    base_row      = fetch_base_url_row(sb, base_url, base_url_id_arg)
+    base_url_id   = str(base_row["base_url_id"])
+    subsegment_id = base_row.get("subsegment_id")
+    subseg_name, seg_name, _ = fetch_subsegment_and_segment(sb, subsegment_id)
+    return {
+        "base_url_id":     base_url_id,
+        "subsegment_name": subseg_name,
+        "segment_name":    seg_name,
+        "keywords":        fetch_keywords(sb, subsegment_id),
+        "pattern":         load_search_pattern(sb, base_url_id, base_url),
+    }
+
+
+INSERT_BATCH = 500
+
+
+class LinkBloom:
+    """
+    Fixed-size Bloom filter of article links already stored in Supabase, so
+    repeat links skip the insert round-trip. A false positive only drops one
+    insert; the filter clears itself once `capacity` links have been added.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.n_bits   = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits     = bytearray((self.n_bits + 7) // 8)
+        self.count    = 0
+
+    def _positions(self, link: str):
+        digest = hashlib.blake2b(link.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.n_bits for i in range(self.n_hashes))
+
+    def __contains__(self, link: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(link))
+
+    def add(self, link: str) -> None:
+        if self.count >= self.capacity:
+            self.bits  = bytearray(len(self.bits))
+            self.count = 0
+        for p in self._positions(link):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+
+_stored_links = LinkBloom()
+
+
+def _uuid4_batch(n: int) -> list:
+    """`n` random UUID4 strings from a single os.urandom call."""
+    raw = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def _article_record(row: dict, article_id: str, job_cols: dict) -> dict:
+    return {
+        "unfiltered_article_id": article_id,
+        "search_url_id":         None,
+        "article_link":          row["article_link"],
+        "article_title":         row.get("article_title"),
+        "article_date":          row.get("article_date"),
+        "companies_mentioned":   row.get("companies_mentioned"),
+        "location":              row.get("location"),
+        "extracted_text":        row.get("extracted_text"),
+        "is_valid":              True,
+        "drop_reason":           None,
+        "filter_article_status": "pending",
+        "subsegment_name":       job_cols.get("subsegment_name"),
+        "base_url_id":           job_cols.get("base_url_id"),
+    }
+
+
+def _insert_rows_individually(sb: SupabaseClient, records: list) -> tuple:
+    """
+    Per-row fallback for a failed batch. RLS WITH CHECK is evaluated per row,
+    so every row gets its own try — except when the key isn't service_role:
+    then an RLS rejection means the key itself lacks rights, and the rest of
+    the chunk is counted as skipped instead of repeating a doomed request.
+    """
+    key_lacks_rights = decode_jwt_role(sb.supabase_key) != "service_role"
     inserted = skipped = 0
-    for row in rows:
-        record = {
-            "unfiltered_article_id": row["unfiltered_article_id"],
-            "search_url_id":         None,
-            "article_link":          row["article_link"],
-            "article_title":         row.get("article_title"),
-            "article_date":          row.get("article_date"),
-            "companies_mentioned":   row.get("companies_mentioned"),
-            "location":              row.get("location"),
-            "extracted_text":        row.get("extracted_text"),
-            "is_valid":              True,
-            "drop_reason":           None,
-            "filter_article_status": "pending",
-            "subsegment_name":       row.get("subsegment_name"),
-            "base_url_id":           row.get("base_url_id"),
-        }
+    for n, record in enumerate(records):
         try:
             sb.table("ses_unfiltered_articles").insert(record).execute()
             inserted += 1
+            _stored_links.add(record["article_link"])
         except Exception as e:
             skipped += 1
             err = str(e)
             if "42501" in err or "row-level security" in err.lower():
-                log.error(f"  [RLS BLOCK] {row['article_link'][:70]} — use service_role key!")
+                log.error(f"  [RLS BLOCK] {record['article_link'][:70]} — use service_role key!")
+                if key_lacks_rights:
+                    rest = len(records) - n - 1
+                    if rest:
+                        log.error(f"  [RLS BLOCK] skipping the remaining {rest} rows of this chunk")
+                    skipped += rest
+                    break
             elif "23505" in err or "duplicate" in err.lower():
-                log.debug(f"  [DUPLICATE] {row['article_link'][:70]}")
+                log.debug(f"  [DUPLICATE] {record['article_link'][:70]}")
+                _stored_links.add(record["article_link"])
             else:
-                log.error(f"  [INSERT ERROR] {row['article_link'][:70]}: {err[:100]}")
+                log.error(f"  [INSERT ERROR] {record['article_link'][:70]}: {err[:100]}")
+    return inserted, skipped
+
+
+# Encoded characters of links per IN (...) probe. Links are quoted and
+# percent-encoded into the GET URL, so chunks are sized by length rather than
+# count to stay well under common 8 KB request-line limits.
+EXISTING_PROBE_URL_BUDGET = 6000
+
+
+def _probe_chunks(links: list):
+    chunk, size = [], 0
+    for link in links:
+        cost = len(quote(link, safe="")) + 9   # quotes + comma, encoded
+        if chunk and size + cost > EXISTING_PROBE_URL_BUDGET:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(link)
+        size += cost
+    if chunk:
+        yield chunk
+
+
+def fetch_existing_links(sb: SupabaseClient, links: list) -> set:
+    """Subset of `links` already in ses_unfiltered_articles."""
+    existing = {l for l in links if l in _stored_links}
+    for chunk in _probe_chunks([l for l in links if l not in existing]):
+        resp = (sb.table("ses_unfiltered_articles")
+                .select("article_link")
+                .in_("article_link", chunk).execute())
+        for r in resp.data:
+            existing.add(r["article_link"])
+            _stored_links.add(r["article_link"])
+    return existing
+
+
+def insert_articles(sb: SupabaseClient, rows: list, job_cols: dict) -> tuple:
+    """
+    Upsert rows in chunks of INSERT_BATCH — one PostgREST call per chunk.
+    `job_cols` holds the columns shared by every row of the job.
+    Links this process has already stored are skipped without a request;
+    other duplicates on article_link are ignored server-side. A chunk that
+    fails outright (RLS, bad row) is retried row-by-row so one bad row
+    doesn't sink the rest.
+    """
+    fresh    = [r for r in rows if r["article_link"] not in _stored_links]
+    inserted = 0
+    skipped  = len(rows) - len(fresh)
+    # IDs are minted here, only for rows that will actually be sent.
+    records  = map(_article_record, fresh, _uuid4_batch(len(fresh)), repeat(job_cols))
+    while chunk := list(islice(records, INSERT_BATCH)):
+        try:
+            # returning=minimal: no row echo; the exact count says how many landed.
+            resp = (sb.table("ses_unfiltered_articles")
+                    .upsert(chunk, on_conflict="article_link", ignore_duplicates=True,
+                            returning="minimal", count="exact")
+                    .execute())
+            ins = resp.count if resp.count is not None else len(chunk)
+            inserted += ins
+            skipped  += len(chunk) - ins
+            for record in chunk:
+                _stored_links.add(record["article_link"])
+        except Exception as e:
+            log.warning(f"  [BATCH INSERT] chunk of {len(chunk)} failed ({str(e)[:100]}) — retrying row-by-row")
+            ins, skip = _insert_rows_individually(sb, chunk)
+            inserted += ins
+            skipped  += skip
     return inserted, skipped
 
 
 # ==============================================================================
-# SEARCH / EXTRACTION CONSTANTS & HELPERS  (unchanged from scraper_v4)
+# SEARCH / EXTRACTION CONSTANTS & HELPERS
 # ==============================================================================
 
 FALLBACK_PATTERNS = [
@@ -327,10 +699,16 @@ FALLBACK_PATTERNS = [
     ("icon_srch_icn",     "icon",  ".search-icon"),
     ("icon_srch_tog",     "icon",  ".search-toggle"),
 ]
+URL_FALLBACKS = [f for f in FALLBACK_PATTERNS if f[1] == "url"]   # independent → raced in parallel
+DOM_FALLBACKS = [f for f in FALLBACK_PATTERNS if f[1] != "url"]   # need the home page, run in order
+DOM_FALLBACK_SELS = [f[2] for f in DOM_FALLBACKS]
 POST_ICON_INPUTS = [
     "input[type='search']", "input[name='q']", "input[name='s']",
     "input[placeholder*='earch' i]", "input[class*='search' i]", "input:visible",
 ]
+# Every search-looking candidate in one locator (1 round-trip instead of 2 per
+# selector); the bare "input:visible" catch-all stays a separate last resort.
+POST_ICON_INPUT_SEL = ", ".join(f"{s}:visible" for s in POST_ICON_INPUTS[:-1])
 ARTICLE_LINK_GROUPS = [
     ["article h1 a[href]","article h2 a[href]","article h3 a[href]",
      "article .entry-title a[href]","article a[href]"],
@@ -341,97 +719,228 @@ ARTICLE_LINK_GROUPS = [
      "[class*='post-item'] a[href]","[class*='news-item'] a[href]"],
     ["main a[href]","#content a[href]",".content a[href]"],
 ]
-NON_ARTICLE_SEGS = {
+NON_ARTICLE_SEGS = frozenset({
     "topics","topic","category","categories","cat","tag","tags","label","labels",
     "explore","browse","author","authors","contributor","page","archive","archives",
     "search","feed","rss","newsletter","subscribe","about","contact","advertise",
     "careers","events","webinar","conference","podcast","video","gallery",
     "product","products","shop","store","login","register","signup","account",
-}
+})
 TITLE_SELS  = ["h1.entry-title","h1.post-title","h1[class*='title']","article h1","h1"]
 DATE_SELS   = ["time[datetime]","[itemprop='datePublished']",".published",
                ".post-date",".entry-date","[class*='date']",
                "meta[property='article:published_time']"]
 TEXT_SELS   = ["article .entry-content","article .post-content",
                "[itemprop='articleBody']",".article-content","article","main"]
-COMPANY_RE  = re.compile(
+# Readiness probes: wait for the first of these instead of a fixed sleep.
+TITLE_READY_SEL   = ", ".join(TITLE_SELS)
+RESULTS_READY_SEL = ", ".join(ARTICLE_LINK_GROUPS[0])
+COMPANY_RE  = entity_re.compile(
     r'\b([A-Z][A-Za-z0-9&\.\-]+(?: [A-Z][A-Za-z0-9&\.\-]+)*'
     r'\s*(?:Inc\.?|Corp\.?|Ltd\.?|LLC|PLC|GmbH|Co\.?|Group|Holdings?'
     r'|Technologies?|Solutions?|Services?))\b'
 )
-LOCATION_RE = re.compile(
+LOCATION_RE = entity_re.compile(
     r'\b([A-Z][a-z]+(?: [A-Z][a-z]+)*),\s*'
     r'([A-Z]{2}|[A-Z][a-z]+(?: [A-Z][a-z]+)*)\b'
 )
 
+# In-page extractors: one CDP round-trip per page instead of one per selector.
+EXTRACT_ARTICLE_JS = """
+({titles, dates, texts}) => {
+    const text  = el => (el.innerText || "").trim();
+    const first = (sels, pick) => {
+        for (const s of sels) {
+            const el = document.querySelector(s);
+            const v  = el && pick(el);
+            if (v) return v;
+        }
+        return null;
+    };
+    return {
+        title: first(titles, text) || document.title.trim(),
+        date:  first(dates, el => el.getAttribute("content")
+                                 || el.getAttribute("datetime") || text(el)),
+        text:  first(texts, el => { const t = text(el); return t.length > 100 ? t.slice(0, 5000) : null; }),
+    };
+}
+"""
+# Hrefs come back absolute (resolved against the page's own URL/<base>) and
+# already stripped of "#", javascript:, mailto: and tel: targets.
+EXTRACT_LINKS_JS = """
+(groups) => groups.map(group => group.flatMap(sel =>
+    Array.from(document.querySelectorAll(sel)).flatMap(el => {
+        const raw = el.getAttribute("href");
+        if (!raw || raw.startsWith("#") || !/^https?:$/.test(el.protocol)) return [];
+        return [[el.href, (el.innerText || "").trim()]];
+    })))
+"""
+# One DOM walk for the whole selector group, then per-selector matches() on
+# the (few) hits — instead of one full-document querySelector per selector.
+SELECTORS_PRESENT_JS = """
+(sels) => {
+    const hits = Array.from(document.querySelectorAll(sels.join(", ")));
+    return sels.map(s => hits.some(el => el.matches(s)));
+}
+"""
+
+
+_SEG_RE   = re.compile(r"/([^/?#]+)")
+# One leftmost-match scan instead of lowercasing every segment for a set probe.
+NON_ARTICLE_RE = re.compile(
+    r"/(" + "|".join(map(re.escape, sorted(NON_ARTICLE_SEGS))) + r")(?=/|$)", re.I
+)
+_BAD_EXTS = frozenset({".pdf",".jpg",".jpeg",".png",".gif",".svg",".zip",".xml",".json",".css",".js"})
 
-def _is_article_url(url: str, anchor: str, base_url: str) -> tuple:
+
+@lru_cache(maxsize=4096)   # the same result links recur across search terms
+def _is_article_url(url: str, anchor: str, base_path: str) -> tuple:
+    """`base_path` is urlparse(base_url).path.rstrip("/"), hoisted by the caller."""
     path = urlparse(url).path.rstrip("/")
     if anchor and len(anchor.strip()) < 20:
         return False, "anchor too short"
-    last = path.lower().split("/")[-1]
-    ext  = ("." + last.rsplit(".", 1)[1]) if "." in last else ""
-    if ext in {".pdf",".jpg",".jpeg",".png",".gif",".svg",".zip",".xml",".json",".css",".js"}:
-        return False, f"bad ext {ext}"
-    for seg in [s.lower() for s in path.split("/") if s]:
-        if seg.split("?")[0].split("#")[0] in NON_ARTICLE_SEGS:
-            return False, f"non-article seg '{seg}'"
-    if len([s for s in path.split("/") if s]) < 2:
+    segs = _SEG_RE.findall(path)
+    if segs:
+        _, dot, ext = segs[-1].lower().rpartition(".")
+        if dot and f".{ext}" in _BAD_EXTS:
+            return False, f"bad ext .{ext}"
+    if m := NON_ARTICLE_RE.search(path):
+        return False, f"non-article seg '{m.group(1).lower()}'"
+    if len(segs) < 2:
         return False, "path too shallow"
-    if path == urlparse(base_url).path.rstrip("/") or path == "":
+    if path == base_path or path == "":
         return False, "is base url"
     return True, "ok"
 
 
+# Shape → strptime formats (tried in order); None means ISO 8601 via
+# datetime.fromisoformat. Anything that matches no shape goes to dateutil.
+_DATE_PATTERNS = [
+    (re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?"
+                r"(?:Z|[+-]\d{2}:?\d{2})?)?"),      None),
+    (re.compile(r"[A-Za-z]{3,9} \d{1,2}, \d{4}"), ("%B %d, %Y", "%b %d, %Y")),
+    (re.compile(r"\d{1,2} [A-Za-z]{3,9} \d{4}"),  ("%d %B %Y", "%d %b %Y")),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"),        ("%m/%d/%Y", "%d/%m/%Y")),
+]
+
+
+@lru_cache(maxsize=4096)
+def _to_datetime(raw: str) -> Optional[datetime]:
+    # Fast path: _is_within_2_years mostly sees _parse_date's own ISO output.
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        pass
+    for shape, fmts in _DATE_PATTERNS:
+        m = shape.match(raw)
+        if not m:
+            continue
+        if fmts is None:
+            try:
+                return datetime.fromisoformat(m.group(0))
+            except ValueError:
+                break
+        for fmt in fmts:
+            try:
+                return datetime.strptime(m.group(0), fmt)
+            except ValueError:
+                continue
+        break
+    try:
+        return date_parser.parse(raw, fuzzy=False)
+    except (ValueError, OverflowError):
+        return None
+
+
 def _is_within_2_years(date_str) -> tuple:
     if not date_str:
         return True, None
-    raw = str(date_str).strip()
-    for fmt in ["%Y-%m-%d %H:%M:%S%z","%Y-%m-%dT%H:%M:%S%z","%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%d %H:%M:%S","%Y-%m-%d","%B %d, %Y","%b %d, %Y",
-                "%d %B %Y","%d %b %Y","%m/%d/%Y","%d/%m/%Y"]:
-        try:
-            parsed = datetime.strptime(raw[:25], fmt)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            if parsed >= TWO_YEAR_CUTOFF:
-                return True, None
-            return False, f"date {parsed.date()} older than cutoff {TWO_YEAR_CUTOFF.date()}"
-        except ValueError:
-            continue
-    return True, None   # unparseable → keep
+    parsed = _to_datetime(str(date_str).strip())
+    if parsed is None:
+        return True, None   # unparseable → keep
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    if parsed >= TWO_YEAR_CUTOFF:
+        return True, None
+    return False, f"date {parsed.date()} older than cutoff {TWO_YEAR_CUTOFF.date()}"
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(raw: str):
     if not raw:
         return None
-    for fmt in ["%Y-%m-%dT%H:%M:%S%z","%Y-%m-%dT%H:%M:%S","%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d","%B %d, %Y","%b %d, %Y","%d %B %Y","%d %b %Y",
-                "%m/%d/%Y","%d/%m/%Y"]:
-        try:
-            dt = datetime.strptime(raw.strip()[:25], fmt)
-            return dt.strftime("%Y-%m-%d %H:%M:%S+05:30")
-        except ValueError:
-            continue
-    return raw
-
+    dt = _to_datetime(raw.strip())
+    if dt is None:
+        return raw
+    return dt.strftime("%Y-%m-%d %H:%M:%S+05:30")
+
+
+# Entity extraction is cached on a digest of the body text — aggregator sites
+# and re-scraped articles repeat bodies often. Bounded like the job store.
+_entity_cache: OrderedDict = OrderedDict()   # blake2b(text) → (companies, location)
+MAX_ENTITY_CACHE    = 2048
+ENTITY_SCAN_CHARS   = 50000   # never regex-scan past this offset
+MAX_COMPANY_MATCHES = 200     # plenty to find 10 distinct names
+
+
+def _extract_entities(text: str) -> tuple:
+    if not text:
+        return None, None
+    key = hashlib.blake2b(text.encode(), digest_size=8).digest()
+    hit = _entity_cache.get(key)
+    if hit is not None:
+        _entity_cache.move_to_end(key)
+        return hit
+    matches   = islice(COMPANY_RE.finditer(text, 0, ENTITY_SCAN_CHARS), MAX_COMPANY_MATCHES)
+    companies = dict.fromkeys(m.group(1) for m in matches)
+    locations = dict.fromkeys(f"{c},{s}" for c, s in LOCATION_RE.findall(text, 0, 500))
+    result = ("; ".join(islice(companies, 10)) or None,
+              "; ".join(islice(locations, 5)) or None)
+    _entity_cache[key] = result
+    if len(_entity_cache) > MAX_ENTITY_CACHE:
+        _entity_cache.popitem(last=False)
+    return result
 
 # ==============================================================================
 # PLAYWRIGHT SEARCH HELPERS
 # ==============================================================================
 
-async def _try_url(page, base_url, keyword, template):
-    url = template.replace("{base}", base_url.rstrip("/")).replace("{keyword}", quote_plus(keyword))
+def _search_url(base_url, keyword, template) -> str:
+    return template.replace("{base}", base_url.rstrip("/")).replace("{keyword}", quote_plus(keyword))
+
+
+async def _url_gone(url: str) -> bool:
+    """
+    True only when a plain HEAD says the URL definitely doesn't exist
+    (404/410). Errors, bot walls and other statuses count as "maybe" and are
+    left for the browser to judge.
+    """
+    if _http_client is None:
+        return False
+    try:
+        r = await _http_client.head(url, timeout=5)
+    except (httpx.HTTPError, httpx.InvalidURL):
+        return False
+    return r.status_code in (404, 410)
+
+
+async def _goto_ok(page, url: str) -> bool:
     try:
         r = await page.goto(url, timeout=20000, wait_until="domcontentloaded")
         return bool(r and r.status < 400)
-    except Exception:
+    except PlaywrightError:
         return False
 
 
+async def _try_url(page, base_url, keyword, template):
+    return await _goto_ok(page, _search_url(base_url, keyword, template))
+
+
 async def _try_input(page, selector, keyword):
     try:
-        el = page.locator(selector).first
+        # Visible matches only: a hidden first match would otherwise burn the
+        # scroll and click timeouts before failing anyway.
+        el = page.locator(selector).locator("visible=true").first
         if await el.count() == 0:
             return False
         await el.scroll_into_view_if_needed(timeout=5000)
@@ -440,94 +949,171 @@ async def _try_input(page, selector, keyword):
         await el.press("Enter")
         await page.wait_for_load_state("domcontentloaded", timeout=15000)
         return True
-    except Exception:
+    except PlaywrightError:
         return False
 
 
 async def _try_icon(page, selector, keyword):
     try:
-        el = page.locator(selector).first
+        el = page.locator(selector).locator("visible=true").first
         if await el.count() == 0:
             return False
         await el.click(timeout=5000)
-        await page.wait_for_timeout(800)
-        for inp in POST_ICON_INPUTS:
-            i = page.locator(inp).first
-            if await i.count() > 0 and await i.is_visible():
+        try:   # same 800ms cap as the old fixed sleep, but returns once a box shows
+            await page.locator(POST_ICON_INPUT_SEL).first.wait_for(timeout=800)
+        except PlaywrightError:
+            pass
+        for sel in (POST_ICON_INPUT_SEL, POST_ICON_INPUTS[-1]):
+            i = page.locator(sel).first
+            if await i.count() > 0:
                 await i.fill(keyword)
                 await i.press("Enter")
                 await page.wait_for_load_state("domcontentloaded", timeout=15000)
                 return True
         return False
-    except Exception:
+    except PlaywrightError:
         return False
 
 
+async def _present_selectors(page, sels: list) -> list:
+    """Per-selector "exists on the page" flags; all True if the probe fails."""
+    try:
+        return await page.evaluate(SELECTORS_PRESENT_JS, sels)
+    except PlaywrightError:
+        return [True] * len(sels)
+
+
+# Pattern method → attempt, all as (page, pattern, keyword, base_url).
+SEARCH_HANDLERS = {
+    "url":   lambda page, pat, keyword, base_url: _try_url(page, base_url, keyword, pat),
+    "input": lambda page, pat, keyword, base_url: _try_input(page, pat, keyword),
+    "icon":  lambda page, pat, keyword, base_url: _try_icon(page, pat, keyword),
+}
+
+
 async def _extract_links(page, base_url) -> list:
-    base_domain = urlparse(base_url).netloc
-    accepted    = {}
-    for group in ARTICLE_LINK_GROUPS:
+    base_parts  = urlparse(base_url)
+    base_path   = base_parts.path.rstrip("/")
+    # "base domain inside the link's host" as one anchored scan, no urlparse per link
+    same_site   = re.compile(r"[a-z][a-z0-9+.-]*://[^/?#]*" + re.escape(base_parts.netloc), re.I).match
+    try:
+        groups = await page.evaluate(EXTRACT_LINKS_JS, ARTICLE_LINK_GROUPS)
+    except PlaywrightError:
+        return []
+    for pairs in groups:
         group_ok = {}
-        for sel in group:
-            try:
-                for el in await page.locator(sel).all():
-                    try:
-                        href = await el.get_attribute("href")
-                        if not href or href.startswith(("#","javascript","mailto","tel")):
-                            continue
-                        abs_url = urljoin(base_url, href)
-                        if base_domain not in urlparse(abs_url).netloc:
-                            continue
-                        if abs_url in accepted or abs_url in group_ok:
-                            continue
-                        try:
-                            text = (await el.inner_text()).strip()
-                        except Exception:
-                            text = ""
-                        keep, _ = _is_article_url(abs_url, text, base_url)
-                        if keep:
-                            group_ok[abs_url] = text
-                    except Exception:
-                        continue
-            except Exception:
+        for abs_url, text in pairs:
+            if not same_site(abs_url):
+                continue
+            if abs_url in group_ok:
                 continue
+            keep, _ = _is_article_url(abs_url, text, base_path)
+            if keep:
+                group_ok[abs_url] = text
         if group_ok:
-            accepted.update(group_ok)
-            break
-    return list(accepted.keys())
+            return list(group_ok.keys())
+    return []
 
 
-async def _search_for_keyword(page, base_url: str, keyword: str, pattern: dict) -> dict:
+async def _race_url_fallbacks(context, base_url: str, keyword: str,
+                              slots: asyncio.Semaphore) -> tuple:
+    """
+    Load every URL fallback at once, each on its own page, but keep list
+    priority: results are taken in template order, so a later template that
+    loads first (often a cached home page for an unknown param) only wins if
+    every template ranked above it failed. Templates below the winner are
+    cancelled. Templates a cheap HEAD shows to be 404 never get a page.
+    `slots` is the job-wide cap on HEADs and page loads in flight, so
+    concurrent searches can't fan out into dozens of requests to one site.
+    Returns (label, page) with the winning page left open for the caller to
+    close, or (None, None).
+    """
+    urls   = [_search_url(base_url, keyword, fpat) for _, _, fpat in URL_FALLBACKS]
+    async def probe(url: str) -> bool:
+        async with slots:
+            return await _url_gone(url)
+
+    gone   = await asyncio.gather(*map(probe, urls))
+    live   = [(label, url) for (label, _, _), url, g in zip(URL_FALLBACKS, urls, gone) if not g]
+    opened = []
+
+    async def attempt(url: str):
+        async with slots:   # tasks queue in priority order, so top templates load first
+            try:
+                page = await context.new_page()
+            except PlaywrightError:
+                return None
+            opened.append(page)
+            return page if await _goto_ok(page, url) else None
+
+    tasks  = [asyncio.create_task(attempt(url)) for _, url in live]
+    winner = None
+    try:
+        for (label, _), task in zip(live, tasks):   # highest priority first
+            page = await task
+            if page is not None:
+                winner = (label, page)
+                break
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for p in opened:
+            if winner is None or p is not winner[1]:
+                await p.close()
+    return winner or (None, None)
+
+
+async def _search_for_keyword(page, base_url: str, keyword: str, pattern: dict,
+                              fallback_slots: asyncio.Semaphore) -> dict:
     result = {"keyword": keyword, "status": "failed",
               "search_url": None, "links": [], "method": None}
 
     try:
         await page.goto(base_url, timeout=25000, wait_until="domcontentloaded")
-    except Exception as e:
+    except PlaywrightError as e:
         result["status"] = "unreachable"
         result["error"]  = str(e)
         return result
+    home_url = page.url   # after redirects
 
     ok = False
     method, pat = pattern.get("method"), pattern.get("pattern")
-    if method and method != "fallback":
-        if   method == "url":   ok = await _try_url(page, base_url, keyword, pat)
-        elif method == "input": ok = await _try_input(page, pat, keyword)
-        elif method == "icon":  ok = await _try_icon(page, pat, keyword)
+    handler = SEARCH_HANDLERS.get(method)   # None for "fallback"/unknown
+    if handler:
+        ok = await handler(page, pat, keyword, base_url)
         if ok:
             result["method"] = method
 
+    url_page = None
+    if not ok:
+        label, url_page = await _race_url_fallbacks(page.context, base_url, keyword, fallback_slots)
+        if url_page:
+            ok   = True
+            page = url_page
+            result["method"] = f"fallback_url:{label}"
+
     if not ok:
-        for label, ftype, fpat in FALLBACK_PATTERNS:
-            if ftype in ("input", "icon"):
+        # One round-trip tells which fallbacks can match at all, instead of a
+        # locator count() per absent selector.
+        present = (await _present_selectors(page, DOM_FALLBACK_SELS)
+                   if page.url == home_url else [True] * len(DOM_FALLBACKS))
+        for (label, ftype, fpat), here in zip(DOM_FALLBACKS, present):
+            if not here:
+                continue
+            # A failed attempt that never submitted leaves the home page as it
+            # was, so only reload when something actually navigated away.
+            if page.url != home_url:
                 try:
                     await page.goto(base_url, timeout=20000, wait_until="domcontentloaded")
-                    await page.wait_for_timeout(500)
-                except Exception:
+                except PlaywrightError:
                     continue
-            if   ftype == "url":   ok = await _try_url(page, base_url, keyword, fpat)
-            elif ftype == "input": ok = await _try_input(page, fpat, keyword)
-            elif ftype == "icon":  ok = await _try_icon(page, fpat, keyword)
+                try:   # let a late-rendered widget attach, without a fixed sleep
+                    await page.wait_for_selector(fpat, state="attached", timeout=500)
+                except PlaywrightError:
+                    pass
+                home_url = page.url
+            ok = await SEARCH_HANDLERS[ftype](page, fpat, keyword, base_url)
             if ok:
                 result["method"] = f"fallback_{ftype}:{label}"
                 break
@@ -536,68 +1122,303 @@ async def _search_for_keyword(page, base_url: str, keyword: str, pattern: dict)
         result["status"] = "no_pattern_worked"
         return result
 
-    result["search_url"] = page.url
-    await page.wait_for_timeout(1500)
-    links = await _extract_links(page, base_url)
-    result["links"]  = links
-    result["status"] = "success" if links else "no_links"
+    try:
+        result["search_url"] = page.url
+        try:
+            await page.wait_for_selector(RESULTS_READY_SEL, timeout=2500)
+        except PlaywrightError:
+            pass
+        links = await _extract_links(page, base_url)
+        result["links"]  = links
+        result["status"] = "success" if links else "no_links"
+    finally:
+        if url_page:
+            await url_page.close()
     return result
 
 
+def _select_first(tree, sels: list, pick):
+    for sel in sels:
+        node = tree.css_first(sel)
+        value = node is not None and pick(node)
+        if value:
+            return value
+    return None
+
+
+async def _extract_article_static(url: str) -> Optional[dict]:
+    """
+    Plain-HTTP fast path mirroring EXTRACT_ARTICLE_JS. Returns None when the
+    page needs a real browser (fetch failed, not HTML, or no title/body —
+    typically a JS-rendered site).
+    """
+    if _http_client is None or HTMLParser is None:
+        return None
+    try:
+        r = await _http_client.get(url)
+    except (httpx.HTTPError, httpx.InvalidURL):
+        return None
+    if r.status_code >= 400 or "html" not in r.headers.get("content-type", ""):
+        return None
+    tree = HTMLParser(r.text)
+    tree.strip_tags(["script", "style", "noscript"])
+
+    def text(node):
+        return node.text(separator=" ", strip=True)
+
+    def body(node):
+        t = text(node)
+        return t[:5000] if len(t) > 100 else None
+
+    raw = {
+        "title": _select_first(tree, TITLE_SELS + ["title"], text),
+        "date":  _select_first(tree, DATE_SELS, lambda n: n.attributes.get("content")
+                                                       or n.attributes.get("datetime") or text(n)),
+        "text":  _select_first(tree, TEXT_SELS, body),
+    }
+    if not raw["title"] or not raw["text"]:
+        return None
+    return raw
+
+
 async def _extract_article(page, url: str) -> dict:
     d = {"article_title": None, "article_date": None,
          "extracted_text": None, "companies_mentioned": None, "location": None}
     try:
-        r = await page.goto(url, timeout=25000, wait_until="domcontentloaded")
-        if r and r.status >= 400:
-            return d
-        await page.wait_for_timeout(1000)
-        for sel in TITLE_SELS:
+        raw = await _extract_article_static(url)
+        if raw is None:
+            r = await page.goto(url, timeout=25000, wait_until="domcontentloaded")
+            if r and r.status >= 400:
+                return d
             try:
-                el = page.locator(sel).first
-                if await el.count() > 0:
-                    t = (await el.inner_text()).strip()
-                    if t:
-                        d["article_title"] = t[:500]
-                        break
-            except Exception:
+                await page.wait_for_selector(TITLE_READY_SEL, timeout=2000)
+            except PlaywrightError:
+                pass
+            raw = await page.evaluate(
+                EXTRACT_ARTICLE_JS,
+                {"titles": TITLE_SELS, "dates": DATE_SELS, "texts": TEXT_SELS},
+            )
+        if raw["title"]:
+            d["article_title"] = raw["title"][:500]
+        if raw["date"]:
+            d["article_date"] = _parse_date(raw["date"])
+        d["extracted_text"] = raw["text"]
+        d["companies_mentioned"], d["location"] = _extract_entities(d["extracted_text"] or "")
+    except Exception as e:
+        log.warning(f"  [article] Failed {url}: {e}")
+    return d
+
+
+# ==============================================================================
+# BROWSER CONTEXTS & PARALLEL ARTICLE EXTRACTION
+# ==============================================================================
+
+ARTICLE_CONCURRENCY  = int(os.getenv("ARTICLE_CONCURRENCY", "8"))
+SEARCH_CONCURRENCY   = int(os.getenv("SEARCH_CONCURRENCY", "4"))     # kept low: one site, rate limits
+FALLBACK_CONCURRENCY = int(os.getenv("FALLBACK_CONCURRENCY", "4"))   # per job, shared by all terms
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Only DOM text/links are read, so anything that is purely visual or tracking
+# is dropped before it hits the network.
+BLOCKED_ASSET_EXTS = ("png","jpe?g","gif","webp","avif","svg","ico","bmp",
+                      "woff2?","ttf","otf","eot","css","mp4","webm","mp3","m4a","ogg","wav","vtt")
+BLOCK_DOMAINS = frozenset({
+    "googletagmanager.com", "google-analytics.com", "doubleclick.net",
+    "googlesyndication.com", "googleadservices.com", "adservice.google.com",
+    "facebook.net", "connect.facebook.net", "amazon-adsystem.com",
+    "scorecardresearch.com", "quantserve.com", "chartbeat.com", "chartbeat.net",
+    "hotjar.com", "clarity.ms", "segment.io", "segment.com", "mixpanel.com",
+    "amplitude.com", "fullstory.com", "optimizely.com", "newrelic.com", "nr-data.net",
+    "taboola.com", "outbrain.com", "criteo.com", "criteo.net", "adnxs.com",
+})
+# Route patterns are regexes rather than a "**/*" callback: Playwright matches
+# them browser-side, so documents/scripts/XHR never take a Python round-trip
+# and only requests about to be aborted reach _abort_route.
+BLOCKED_ASSET_RE = re.compile(
+    r"^[^?#]*\.(?:" + "|".join(BLOCKED_ASSET_EXTS) + r")(?:[?#]|$)", re.I
+)
+BLOCKED_HOST_RE = re.compile(
+    r"^[a-z][a-z0-9+.-]*://(?:[^/?#@]*@)?(?:[^/?#:]*\.)?(?:"
+    + "|".join(re.escape(d) for d in sorted(BLOCK_DOMAINS))
+    + r")(?::\d+)?(?:[/?#]|$)", re.I
+)
+
+
+async def _abort_route(route):
+    await route.abort()
+
+
+async def _new_context(browser):
+    context = await browser.new_context(
+        user_agent=USER_AGENT,
+        viewport={"width": 1280, "height": 800},
+    )
+    await context.route(BLOCKED_ASSET_RE, _abort_route)
+    await context.route(BLOCKED_HOST_RE, _abort_route)
+    return context
+
+
+class ContextPool:
+    """
+    Pre-warmed BrowserContexts shared across scrape jobs — one per scrape
+    worker, so job startup skips new_context() + route setup. A released
+    context is scrubbed (cookies, permissions, open pages) before the next
+    job gets it. One that fails to scrub is discarded and its slot goes back
+    as None, rebuilt by the next acquire() — so a dead browser surfaces as a
+    job error there instead of slowly draining the pool.
+    """
+
+    def __init__(self, browser, size: int):
+        self.browser = browser
+        self.size    = size
+        self._queue: asyncio.Queue = asyncio.Queue()   # context, or None = rebuild
+
+    async def start(self):
+        for _ in range(self.size):
+            self._queue.put_nowait(await _new_context(self.browser))
+
+    async def acquire(self):
+        context = await self._queue.get()
+        if context is None:
+            try:
+                context = await _new_context(self.browser)
+            except BaseException:
+                self._queue.put_nowait(None)   # keep the slot for the next job
+                raise
+        return context
+
+    async def release(self, context):
+        keep = None
+        try:
+            for page in context.pages:
+                await page.close()
+            await context.clear_cookies()
+            await context.clear_permissions()
+            keep = context
+        except Exception as e:
+            log.warning(f"[CTX] Scrub failed, discarding context: {e}")
+            try:
+                await context.close()
+            except PlaywrightError:
+                pass
+        finally:
+            self._queue.put_nowait(keep)
+
+    async def close(self):
+        while not self._queue.empty():
+            context = self._queue.get_nowait()
+            if context is None:
                 continue
-        if not d["article_title"]:
             try:
-                d["article_title"] = (await page.title()).strip()[:500]
-            except Exception:
+                await context.close()
+            except PlaywrightError:
                 pass
-        for sel in DATE_SELS:
+
+
+class PagePool:
+    """
+    Fixed set of pre-opened pages on one BrowserContext, leased to one
+    coroutine at a time. Reusing pages skips per-URL new_page()/close() and
+    keeps the context's cache and cookie jar warm across articles.
+    """
+
+    def __init__(self, context, size: int):
+        self.context = context
+        self.size    = size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pages: list = []
+        self._starting: Optional[asyncio.Future] = None
+
+    async def _start(self):
+        # A pool short of pages still works (leases just wait longer); one
+        # with no page at all would leave every waiter blocked, so it raises.
+        for _ in range(self.size):
             try:
-                el = page.locator(sel).first
-                if await el.count() > 0:
-                    raw = (await el.get_attribute("content")
-                           or await el.get_attribute("datetime")
-                           or (await el.inner_text()).strip())
-                    if raw:
-                        d["article_date"] = _parse_date(raw)
-                        break
-            except Exception:
-                continue
-        for sel in TEXT_SELS:
+                page = await self.context.new_page()
+            except PlaywrightError as e:
+                if not self._pages:
+                    raise
+                log.warning(f"[POOL] opened {len(self._pages)}/{self.size} pages: {e}")
+                break
+            self._pages.append(page)
+            self._queue.put_nowait(page)
+
+    async def acquire(self):
+        # Every caller awaits the same start, so a failure reaches all of
+        # them instead of leaving the rest blocked on an empty queue.
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(self._start())
+        await asyncio.shield(self._starting)
+        return await self._queue.get()
+
+    async def release(self, page):
+        try:
+            await page.goto("about:blank")
+        except PlaywrightError:
+            pass
+        self._queue.put_nowait(page)
+
+    @asynccontextmanager
+    async def lease(self):
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self):
+        if self._starting is not None and not self._starting.done():
+            self._starting.cancel()
+            await asyncio.gather(self._starting, return_exceptions=True)
+        for page in self._pages:
             try:
-                el = page.locator(sel).first
-                if await el.count() > 0:
-                    txt = (await el.inner_text()).strip()
-                    if len(txt) > 100:
-                        d["extracted_text"] = txt[:5000]
-                        break
-            except Exception:
+                await page.close()
+            except PlaywrightError:
+                pass
+
+
+async def _extract_articles_parallel(context, urls: list,
+                                     concurrency: int = ARTICLE_CONCURRENCY):
+    """
+    Async generator yielding (url, details) as each article finishes.
+    `concurrency` workers, each holding one pooled page on the job's
+    BrowserContext, drain a shared URL queue — so a slow page only holds up
+    its own worker and the caller can filter/insert rows as they arrive.
+    """
+    todo: asyncio.Queue = asyncio.Queue()
+    for url in urls:
+        todo.put_nowait(url)
+    done: asyncio.Queue = asyncio.Queue()   # (url, details), or None when a worker exits
+    pool = PagePool(context, max(1, min(concurrency, len(urls))))
+
+    async def worker():
+        try:
+            async with pool.lease() as page:
+                while not todo.empty():
+                    url = todo.get_nowait()
+                    await done.put((url, await _extract_article(page, url)))
+        finally:
+            done.put_nowait(None)
+
+    workers  = [asyncio.create_task(worker()) for _ in range(pool.size)]
+    finished = 0
+    try:
+        while finished < len(workers):
+            item = await done.get()
+            if item is None:
+                finished += 1
                 continue
-        src = d["extracted_text"] or ""
-        companies = COMPANY_RE.findall(src)
-        d["companies_mentioned"] = "; ".join(list(dict.fromkeys(companies))[:10]) or None
-        locs = LOCATION_RE.findall(src[:500])
-        d["location"] = "; ".join(
-            list(dict.fromkeys(f"{c},{s}" for c, s in locs))[:5]) or None
-    except Exception as e:
-        log.warning(f"  [article] Failed {url}: {e}")
-    return d
+            yield item
+        await asyncio.gather(*workers)   # surface a worker crash
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await pool.close()
 
 
 # ==============================================================================
@@ -605,28 +1426,34 @@ async def _extract_article(page, url: str) -> dict:
 # ==============================================================================
 
 async def _run_scrape(job_id: str, req: ScrapeRequest):
-    job = _jobs[job_id]
+    job = _jobs.get(job_id)
+    if job is None:
+        log.warning(f"[{job_id[:8]}] job no longer in store — skipped")
+        return
     job["status"]     = "running"
-    job["started_at"] = datetime.utcnow().isoformat()
+    job["started_at"] = time.time()
 
     def progress(msg: str):
-        job["progress"][datetime.utcnow().isoformat()] = msg
+        job["progress"].append((time.time(), msg))   # rendered by _job_view
         log.info(f"[{job_id[:8]}] {msg}")
 
+    context = None
     try:
         # ── Supabase init ────────────────────────────────────────────
+        # supabase-py is synchronous: every call below runs in a worker
+        # thread so Playwright pages on the event loop keep progressing.
         sb = get_supabase_client()
         progress(f"Supabase connected | role=service_role")
 
         base_url = req.base_url.rstrip("/")
 
         # ── Load metadata from Supabase ──────────────────────────────
-        base_row      = fetch_base_url_row(sb, base_url, req.base_url_id)
-        base_url_id   = str(base_row["base_url_id"])
-        subsegment_id = base_row.get("subsegment_id")
-
-        subseg_name, seg_name, _ = fetch_subsegment_and_segment(sb, subsegment_id)
-        keywords                  = fetch_keywords(sb, subsegment_id)
+        boot        = await asyncio.to_thread(fetch_scrape_bootstrap, sb, base_url, req.base_url_id)
+        base_url_id = boot["base_url_id"]
+        subseg_name = boot["subsegment_name"]
+        seg_name    = boot["segment_name"]
+        keywords    = boot["keywords"]
+        pattern     = boot["pattern"]
 
         if keywords:
             search_terms  = keywords
@@ -640,116 +1467,101 @@ async def _run_scrape(job_id: str, req: ScrapeRequest):
         else:
             raise ValueError("No keywords, subsegment, or segment found for this URL.")
 
-        pattern = load_search_pattern(sb, base_url_id, base_url)
         progress(f"Pattern loaded: method={pattern['method']} | {len(search_terms)} terms")
 
         # ── Playwright Phase 1 — collect links ───────────────────────
-        all_links: dict = {}
-        context = await _browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            viewport={"width": 1280, "height": 800},
-        )
-        await context.route(
-            "**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf,eot,mp4,webm}",
-            lambda route: route.abort(),
-        )
-
-        search_page = await context.new_page()
-        for idx, term in enumerate(search_terms, 1):
-            progress(f"[{idx}/{len(search_terms)}] Searching '{term}'")
-            res = await _search_for_keyword(search_page, base_url, term, pattern)
-            await search_page.wait_for_timeout(1000)
-            new_count = 0
-            for link in res["links"]:
-                if link not in all_links:
-                    all_links[link] = {
-                        "keyword":    term,
-                        "search_url": res["search_url"],
-                        "method":     res["method"],
-                    }
-                    new_count += 1
-            progress(f"  '{term}' → status={res['status']} links={len(res['links'])} new={new_count} total={len(all_links)}")
-
-        progress(f"Phase 1 done — {len(all_links)} unique links")
+        seen_urls: dict = {}      # insertion-ordered set of links
+        context = await _context_pool.acquire()
+
+        # Terms are searched concurrently on pooled pages, but merged in term
+        # order so link order doesn't depend on which search won.
+        # Tasks are created through a sliding window (2× the pool) rather than
+        # all up front, so a long keyword list doesn't mean one task per term.
+        search_pool    = PagePool(context, max(1, min(SEARCH_CONCURRENCY, len(search_terms))))
+        fallback_slots = asyncio.Semaphore(max(1, FALLBACK_CONCURRENCY))
+
+        async def search(term: str) -> dict:
+            async with search_pool.lease() as page:
+                return await _search_for_keyword(page, base_url, term, pattern, fallback_slots)
+
+        upcoming = iter(search_terms)
+        searches = deque((t, asyncio.create_task(search(t)))
+                         for t in islice(upcoming, 2 * search_pool.size))
+        try:
+            for idx in range(1, len(search_terms) + 1):
+                term, task = searches[0]
+                for nxt in islice(upcoming, 1):
+                    searches.append((nxt, asyncio.create_task(search(nxt))))
+                res = await task
+                searches.popleft()
+                progress(f"[{idx}/{len(search_terms)}] Searched '{term}'")
+                before = len(seen_urls)
+                seen_urls.update(dict.fromkeys(res["links"]))
+                new_count = len(seen_urls) - before
+                progress(f"  '{term}' → status={res['status']} links={len(res['links'])} new={new_count} total={len(seen_urls)}")
+        finally:
+            for _, t in searches:
+                t.cancel()
+            await asyncio.gather(*(t for _, t in searches), return_exceptions=True)
+            await search_pool.close()
+
+        progress(f"Phase 1 done — {len(seen_urls)} unique links")
 
         # ── Playwright Phase 2 — article details + insert ────────────
-        output_rows    = []
+        job_cols       = {"subsegment_name": subseg_name, "base_url_id": base_url_id}
+        kept           = 0   # rows past the date filter; row bodies are not retained
         total_inserted = 0
         total_skipped  = 0
 
-        if not req.skip_article_visit and all_links:
-            art_page = await context.new_page()
+        if not req.skip_article_visit and seen_urls:
             batch    = []
-            urls     = list(all_links.keys())
-
-            for idx, art_url in enumerate(urls, 1):
-                if idx % 10 == 0:
-                    progress(f"  Article {idx}/{len(urls)} ...")
-                src     = all_links[art_url]
-                details = await _extract_article(art_page, art_url)
-                await art_page.wait_for_timeout(800)
+            try:
+                existing = await asyncio.to_thread(fetch_existing_links, sb, list(seen_urls))
+            except Exception as e:
+                # Only an optimisation: visit everything, insert dedup still applies.
+                log.warning(f"[{job_id[:8]}] stored-link check failed ({str(e)[:100]}) — visiting all links")
+                existing = set()
+            urls     = [u for u in seen_urls if u not in existing]   # keeps discovery order
+            visited  = 0
+            total_skipped += len(existing)
+            progress(f"  {len(existing)} already stored — visiting {len(urls)} new articles")
+
+            async for art_url, details in _extract_articles_parallel(context, urls):
+                visited += 1
+                if visited % 10 == 0:
+                    progress(f"  Article {visited}/{len(urls)} ...")
 
                 keep, drop_reason = _is_within_2_years(details["article_date"])
                 if not keep:
                     log.info(f"  [DATE FILTER] {drop_reason} → {art_url[:60]}")
                     continue
 
-                row = {
-                    "unfiltered_article_id": str(uuid.uuid4()),
-                    "article_link":          art_url,
-                    "article_title":         details["article_title"],
-                    "article_date":          details["article_date"],
-                    "companies_mentioned":   details["companies_mentioned"],
-                    "location":              details["location"],
-                    "extracted_text":        details["extracted_text"],
-                    "is_valid":              True,
-                    "drop_reason":           None,
-                    "filter_article_status": "pending",
-                    "created_at":            datetime.now().strftime("%Y-%m-%d %H:%M:%S+05:30"),
-                    "subsegment_name":       subseg_name,
-                    "base_url_id":           base_url_id,
-                    "keyword_used":          src["keyword"],
-                    "search_url":            src["search_url"],
-                    "method_used":           src["method"],
-                    "search_term_source":    term_source,
-                }
-                batch.append(row)
-                output_rows.append(row)
-
-                if len(batch) >= 20:
-                    ins, skip = insert_articles(sb, batch)
+                # The extracted fields already are the row; job-wide columns
+                # are passed once per flush instead of copied into every row.
+                details["article_link"] = art_url
+                batch.append(details)
+                kept += 1
+
+                if len(batch) >= INSERT_BATCH:
+                    ins, skip = await asyncio.to_thread(insert_articles, sb, batch, job_cols)
                     total_inserted += ins
                     total_skipped  += skip
                     progress(f"  Batch inserted={ins} skipped={skip}")
                     batch.clear()
 
             if batch:
-                ins, skip = insert_articles(sb, batch)
+                ins, skip = await asyncio.to_thread(insert_articles, sb, batch, job_cols)
                 total_inserted += ins
                 total_skipped  += skip
 
         else:
             progress("Phase 2 skipped (skip_article_visit=true)")
-            for art_url, src in all_links.items():
-                output_rows.append({
-                    "unfiltered_article_id": str(uuid.uuid4()),
-                    "article_link":    art_url,
-                    "article_title":   None, "article_date":      None,
-                    "extracted_text":  None, "subsegment_name":   subseg_name,
-                    "base_url_id":     base_url_id,
-                    "keyword_used":    src["keyword"],
-                    "method_used":     src["method"],
-                })
-            ins, skip = insert_articles(sb, output_rows)
+            output_rows = [{"article_link": art_url} for art_url in seen_urls]
+            kept      = len(output_rows)
+            ins, skip = await asyncio.to_thread(insert_articles, sb, output_rows, job_cols)
             total_inserted += ins
             total_skipped  += skip
 
-        await context.close()
-
         # ── Final result ─────────────────────────────────────────────
         job["result"] = {
             "base_url":          base_url,
@@ -758,13 +1570,13 @@ async def _run_scrape(job_id: str, req: ScrapeRequest):
             "segment":           seg_name,
             "term_source":       term_source,
             "search_terms":      search_terms,
-            "unique_links":      len(all_links),
-            "after_date_filter": len(output_rows),
+            "unique_links":      len(seen_urls),
+            "after_date_filter": kept,
             "inserted":          total_inserted,
             "skipped":           total_skipped,
         }
         job["status"]      = "done"
-        job["finished_at"] = datetime.utcnow().isoformat()
+        job["finished_at"] = time.time()
         log.info(f"[SUPABASE] ✓ {total_inserted} articles saved to ses_unfiltered_articles | {total_skipped} skipped (duplicates/errors)")
         progress(f"DONE — inserted={total_inserted} skipped={total_skipped}")
 
@@ -772,7 +1584,21 @@ async def _run_scrape(job_id: str, req: ScrapeRequest):
         log.error(f"[{job_id[:8]}] FAILED: {e}", exc_info=True)
         job["status"]      = "error"
         job["error"]       = str(e)
-        job["finished_at"] = datetime.utcnow().isoformat()
+        job["finished_at"] = time.time()
+    finally:
+        if context:
+            await _context_pool.release(context)
+
+
+async def _scrape_worker(queue: asyncio.Queue):
+    while True:
+        job_id, req = await queue.get()
+        try:
+            await _run_scrape(job_id, req)
+        except Exception as e:
+            log.error(f"[{job_id[:8]}] worker error: {e}", exc_info=True)
+        finally:
+            queue.task_done()
 
 
 # ==============================================================================
@@ -805,14 +1631,17 @@ async def health():
         "browser_ready":    _browser is not None and _browser.is_connected(),
         "supabase_key_ok":  sb_ok,
         "active_jobs":      sum(1 for j in _jobs.values() if j["status"] == "running"),
+        "queued_jobs":      _scrape_queue.qsize(),
+        "scrape_workers":   SCRAPE_WORKERS,
         "total_jobs":       len(_jobs),
     }
 
 
 @app.post("/scrape", response_model=ScrapeAccepted, status_code=202)
-async def start_scrape(req: ScrapeRequest, bg: BackgroundTasks):
+async def start_scrape(req: ScrapeRequest):
     """
-    Fire-and-forget scrape.  Returns a job_id immediately.
+    Fire-and-forget scrape.  Returns a job_id immediately; the job waits in
+    the queue until one of the SCRAPE_WORKERS picks it up.
     Poll GET /job/{job_id} to check progress and get results.
     """
     if _browser is None or not _browser.is_connected():
@@ -820,7 +1649,7 @@ async def start_scrape(req: ScrapeRequest, bg: BackgroundTasks):
 
     job_id = f"job_{int(time.time())}_{uuid.uuid4().hex[:6]}"
     _new_job(job_id, req.model_dump())
-    bg.add_task(_run_scrape, job_id, req)
+    _scrape_queue.put_nowait((job_id, req))
     return ScrapeAccepted(
         job_id=job_id,
         status="queued",
@@ -834,14 +1663,14 @@ async def get_job(job_id: str):
     job = _jobs.get(job_id)
     if not job:
         raise HTTPException(404, detail=f"Job '{job_id}' not found.")
-    return job
+    return _job_view(job)
 
 
 @app.get("/jobs")
 async def list_jobs(limit: int = 20):
     """List recent jobs (newest first)."""
-    jobs = list(reversed(list(_jobs.values())))
-    return {"total": len(_jobs), "jobs": jobs[:max(1, min(limit, 100))]}
+    newest = islice(reversed(_job_order), max(1, min(limit, 100)))
+    return {"total": len(_jobs), "jobs": [_job_view(_jobs[j]) for j in newest]}
 
 
 # ==============================================================================
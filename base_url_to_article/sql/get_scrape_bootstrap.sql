@@ -0,0 +1,48 @@
+-- Everything _run_scrape needs before Playwright starts, in one round-trip.
+-- Called from main.fetch_scrape_bootstrap(); returns one row, or none if the
+-- base URL is unknown. It is a set-returning function so PostgREST replies with
+-- a JSON array, which postgrest-py's APIResponse requires (a bare object fails
+-- validation). Resolution rules mirror the per-table fetchers in main.py:
+--   * base_url_id wins when given, else base_url with or without trailing "/"
+--   * search pattern by base_url_id first, then by either base_url spelling
+create or replace function get_scrape_bootstrap(p_base_url text, p_base_url_id text default null)
+returns setof json
+language sql
+stable
+as $$
+    with b as (
+        select base_url_id, base_url, subsegment_id
+        from ses_base_url
+        where (p_base_url_id is not null and base_url_id::text = p_base_url_id)
+           or (p_base_url_id is null and base_url in (p_base_url, p_base_url || '/'))
+        order by base_url = p_base_url desc
+        limit 1
+    )
+    select json_build_object(
+        'base_url_id',     b.base_url_id,
+        'base_url',        b.base_url,
+        'subsegment_id',   b.subsegment_id,
+        'subsegment_name', ss.subsegment_name,
+        'segment_id',      ss.segment_id,
+        'segment_name',    sg.segment_name,
+        'keywords', coalesce(
+            (select array_agg(k.keyword)
+             from ses_keywords k
+             where k.subsegment_id = b.subsegment_id and k.keyword is not null),
+            '{}'),
+        'pattern', (
+            select json_build_object(
+                'method',      p.method,
+                'pattern',     p.pattern,
+                'confidence',  p.confidence,
+                'result_type', p.result_type)
+            from base_url_search_patterns p
+            where p.base_url_id = b.base_url_id
+               or p.base_url in (rtrim(b.base_url, '/'), rtrim(b.base_url, '/') || '/')
+            order by coalesce(p.base_url_id = b.base_url_id, false) desc
+            limit 1)
+    )
+    from b
+    left join ses_subsegments ss on ss.subsegment_id = b.subsegment_id
+    left join ses_segments    sg on sg.segment_id    = ss.segment_id;
+$$;